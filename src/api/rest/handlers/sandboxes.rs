@@ -945,6 +945,7 @@ pub async fn cancel_task(
             SandboxTask::update_by_id(&state.db, &task_id, req)
                 .await
                 .map_err(|e| ApiError::Internal(anyhow::anyhow!("Failed to cancel task: {}", e)))?;
+            state.task_waiters.notify([task_id.as_str()]);
             cancelled = true;
         } else {
             return Err(ApiError::Conflict(
@@ -1265,7 +1266,7 @@ pub async fn terminate_sandbox(
     .await
     .map_err(|e| ApiError::Internal(anyhow::anyhow!("Failed to load tasks: {}", e)))?;
 
-    for (task_id,) in active_tasks {
+    for (task_id,) in &active_tasks {
         let req = UpdateTaskRequest {
             status: Some("cancelled".to_string()),
             input: None,
@@ -1280,11 +1281,14 @@ pub async fn terminate_sandbox(
             completion_tokens_delta: None,
             tool_used: None,
         };
-        SandboxTask::update_by_id(&state.db, &task_id, req)
+        SandboxTask::update_by_id(&state.db, task_id, req)
             .await
             .map_err(|e| {
                 ApiError::Internal(anyhow::anyhow!("Failed to cancel task {}: {}", task_id, e))
             })?;
+        // Notify as each cancel lands so an error on a later task cannot skip
+        // waiters for tasks already cancelled.
+        state.task_waiters.notify([task_id.as_str()]);
     }
 
     let pending_requests = sqlx::query_as::<_, (String, serde_json::Value)>(
@@ -1825,6 +1829,13 @@ pub async fn list_tasks(
     Ok(Json(tasks))
 }
 
+fn is_terminal_task_status(status: &str) -> bool {
+    matches!(
+        status.to_lowercase().as_str(),
+        "completed" | "failed" | "cancelled"
+    )
+}
+
 pub async fn create_task(
     State(state): State<Arc<AppState>>,
     Path(id): Path<String>,
@@ -1914,6 +1925,9 @@ pub async fn create_task(
         let start = Instant::now();
         let timeout = Duration::from_secs(15 * 60);
         let poll_interval = Duration::from_millis(500);
+        // Wakes early when this API process records the task as finished; the
+        // poll still covers statuses written by the controller or other replicas.
+        let waiter = state.task_waiters.register(&task_id);
 
         loop {
             if start.elapsed() >= timeout {
@@ -1922,10 +1936,15 @@ pub async fn create_task(
                 ));
             }
 
+            // Register before reading the task so an update landing in between
+            // still wakes this request.
+            let notified = waiter.notified();
+            tokio::pin!(notified);
+            notified.as_mut().enable();
+
             match SandboxTask::find_by_id(&state.db, &task_id).await {
                 Ok(Some(cur)) => {
-                    let status_lc = cur.status.to_lowercase();
-                    if matches!(status_lc.as_str(), "completed" | "failed" | "cancelled") {
+                    if is_terminal_task_status(&cur.status) {
                         return Ok(Json(TaskView {
                             id: cur.id,
                             sandbox_id: cur.sandbox_id,
@@ -1951,7 +1970,10 @@ pub async fn create_task(
                 }
             }
 
-            sleep(poll_interval).await;
+            tokio::select! {
+                _ = &mut notified => {}
+                _ = sleep(poll_interval) => {}
+            }
         }
     }
 
@@ -2060,11 +2082,20 @@ pub async fn update_task(
     let prompt_delta = req.prompt_tokens_delta.unwrap_or(0).max(0);
     let completion_delta = req.completion_tokens_delta.unwrap_or(0).max(0);
     let tool_used_req = req.tool_used.clone();
+    let finished = req
+        .status
+        .as_deref()
+        .map(is_terminal_task_status)
+        .unwrap_or(false);
 
     let updated = SandboxTask::update_by_id(&state.db, &task_id, req)
         .await
         .map_err(|e| ApiError::Internal(anyhow::anyhow!("Failed to update task: {}", e)))?;
 
+    if finished {
+        state.task_waiters.notify([task_id.as_str()]);
+    }
+
     if prompt_delta > 0 || completion_delta > 0 {
         sqlx::query(
             r#"
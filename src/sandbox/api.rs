@@ -56,6 +56,11 @@ impl TSBXClient {
         }
     }
 
+    /// Sandbox id this client is bound to (known locally from config)
+    pub fn sandbox_id(&self) -> &str {
+        &self.sandbox_id
+    }
+
     pub async fn update_task_usage(
         &self,
         id: &str,
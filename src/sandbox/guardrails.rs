@@ -1,14 +1,32 @@
 use super::error::{HostError, Result};
+use aho_corasick::AhoCorasick;
 use tracing::{debug, warn};
 
+const HARMFUL_PATTERNS: [&str; 5] = [
+    "rm -rf /",
+    "format c:",
+    ":(){:|:&};:", // Fork bomb
+    "dd if=/dev/zero of=/dev/sda",
+    "mkfs /dev/sda",
+];
+
 pub struct Guardrails {
     max_message_length: usize,
+    harmful_matcher: AhoCorasick,
 }
 
 impl Guardrails {
     pub fn new() -> Self {
+        // Single automaton so content is scanned once for all patterns,
+        // case-insensitively, without lowercasing a copy first.
+        let harmful_matcher = AhoCorasick::builder()
+            .ascii_case_insensitive(true)
+            .build(HARMFUL_PATTERNS)
+            .expect("Failed to build guardrail pattern matcher");
+
         Self {
             max_message_length: 100_000,
+            harmful_matcher,
         }
     }
 
@@ -44,23 +62,14 @@ impl Guardrails {
 
     /// Check for critical system-level destructive commands only
     pub fn check_system_safety(&self, content: &str) -> Result<()> {
-        let harmful_patterns = [
-            "rm -rf /",
-            "format c:",
-            ":(){:|:&};:", // Fork bomb
-            "dd if=/dev/zero of=/dev/sda",
-            "mkfs /dev/sda",
-        ];
-
-        let lower_content = content.to_lowercase();
-
-        for pattern in harmful_patterns {
-            if lower_content.contains(pattern) {
-                warn!("Critical system destructive command detected: {}", pattern);
-                return Err(HostError::Guardrail(
-                    "Request contains system-destructive commands".to_string(),
-                ));
-            }
+        if let Some(found) = self.harmful_matcher.find(content) {
+            warn!(
+                "Critical system destructive command detected: {}",
+                HARMFUL_PATTERNS[found.pattern().as_usize()]
+            );
+            return Err(HostError::Guardrail(
+                "Request contains system-destructive commands".to_string(),
+            ));
         }
 
         Ok(())
@@ -1,4 +1,5 @@
 use super::error::{HostError, Result};
+use reqwest::header::{HeaderMap, HeaderValue, AUTHORIZATION};
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use std::cmp::max;
@@ -9,7 +10,6 @@ use std::sync::Arc;
 pub struct InferenceClient {
     client: Client,
     base_url: String,
-    auth_header: String,
     log_seq: Arc<AtomicU64>,
     model: String,
 }
@@ -42,20 +42,21 @@ pub struct ModelResponse {
 const FORMAT_HINT: &str =
     "Format notice: Respond with a single XML element (e.g. <run_bash .../> or <output>...</output>).";
 
+// Request types borrow from the conversation so building a request copies no message text.
 #[derive(Debug, Serialize, Clone)]
-struct ChatRequestMessage {
-    role: String,
-    content: String,
+struct ChatRequestMessage<'a> {
+    role: &'a str,
+    content: &'a str,
     #[serde(skip_serializing_if = "Option::is_none")]
-    name: Option<String>,
+    name: Option<&'a str>,
     #[serde(skip_serializing_if = "Option::is_none")]
-    tool_call_id: Option<String>,
+    tool_call_id: Option<&'a str>,
 }
 
 #[derive(Debug, Serialize)]
-struct ChatRequest {
-    model: String,
-    messages: Vec<ChatRequestMessage>,
+struct ChatRequest<'a> {
+    model: &'a str,
+    messages: Vec<ChatRequestMessage<'a>>,
     stream: bool,
 }
 
@@ -89,19 +90,34 @@ impl InferenceClient {
             .and_then(|v| v.parse::<u64>().ok())
             .unwrap_or(900);
 
+        // The API key is fixed for the sandbox lifetime, so attach it once as a
+        // default header rather than re-applying it on every request.
+        let raw_key = std::env::var("TSBX_INFERENCE_API_KEY").unwrap_or_else(|_| "".to_string());
+        let trimmed_key = raw_key.trim();
+        let mut default_headers = HeaderMap::new();
+        if !trimmed_key.is_empty() {
+            // A malformed key must not stop the sandbox from starting: SH/PY/JS tasks
+            // never call inference, and NL requests will surface the provider's auth error.
+            match HeaderValue::from_str(&format!("Bearer {}", trimmed_key)) {
+                Ok(mut auth_value) => {
+                    auth_value.set_sensitive(true);
+                    default_headers.insert(AUTHORIZATION, auth_value);
+                }
+                Err(e) => {
+                    tracing::error!(
+                        "TSBX_INFERENCE_API_KEY is not a valid header value ({}); sending inference requests without Authorization",
+                        e
+                    );
+                }
+            }
+        }
+
         let client = Client::builder()
             .timeout(std::time::Duration::from_secs(timeout_secs))
+            .default_headers(default_headers)
             .build()
             .map_err(|e| HostError::Model(format!("Failed to create inference client: {}", e)))?;
 
-        let raw_key = std::env::var("TSBX_INFERENCE_API_KEY").unwrap_or_else(|_| "".to_string());
-        let trimmed_key = raw_key.trim();
-        let auth_header = if trimmed_key.is_empty() {
-            "".to_string()
-        } else {
-            format!("Bearer {}", trimmed_key)
-        };
-
         let raw_model = std::env::var("TSBX_INFERENCE_MODEL")
             .map_err(|_| HostError::Model("TSBX_INFERENCE_MODEL must be set".to_string()))?;
         let trimmed_model = raw_model.trim();
@@ -115,7 +131,6 @@ impl InferenceClient {
         Ok(Self {
             client,
             base_url: base_url.trim_end_matches('/').to_string(),
-            auth_header,
             log_seq: Arc::new(AtomicU64::new(0)),
             model,
         })
@@ -123,36 +138,38 @@ impl InferenceClient {
 
     pub async fn complete(
         &self,
-        messages: Vec<ChatMessage>,
-        system_prompt: Option<String>,
+        messages: &[ChatMessage],
+        system_prompt: Option<&str>,
     ) -> Result<ModelResponse> {
         const PARSE_RETRIES: usize = 5;
-        let base_messages = messages.clone();
+        // Retries reuse one copy of the conversation with the format hint appended.
+        let mut hinted_messages: Option<Vec<ChatMessage>> = None;
 
         for attempt in 0..PARSE_RETRIES {
-            let mut attempt_messages = base_messages.clone();
-
-            if attempt > 0 {
-                attempt_messages.push(ChatMessage {
+            if attempt > 0 && hinted_messages.is_none() {
+                let mut hinted = messages.to_vec();
+                hinted.push(ChatMessage {
                     role: "system".to_string(),
                     content: FORMAT_HINT.to_string(),
                     name: None,
                     tool_call_id: None,
                 });
+                hinted_messages = Some(hinted);
             }
+            let attempt_messages = hinted_messages.as_deref().unwrap_or(messages);
 
-            let req_value =
-                build_request(attempt_messages.clone(), system_prompt.clone(), &self.model)?;
-
-            let estimated_context_length = Self::estimate_context_length(&attempt_messages);
+            let req = build_request(attempt_messages, system_prompt, &self.model)?;
 
             let log_id = self.log_seq.fetch_add(1, Ordering::SeqCst) + 1;
-            self.log_inference_request(&req_value, log_id).await;
+            self.log_inference_request(&req, log_id).await;
 
-            let mut request_builder = self.client.post(self.base_url.as_str()).json(&req_value);
-            request_builder = request_builder.header("Authorization", &self.auth_header);
-
-            let resp = request_builder.send().await.map_err(HostError::Request)?;
+            let resp = self
+                .client
+                .post(self.base_url.as_str())
+                .json(&req)
+                .send()
+                .await
+                .map_err(HostError::Request)?;
 
             if !resp.status().is_success() {
                 let status = resp.status();
@@ -179,7 +196,7 @@ impl InferenceClient {
 
             self.log_inference_response(&response_text, log_id).await;
 
-            match parse_response(&response_text, estimated_context_length) {
+            match parse_response(&response_text, attempt_messages) {
                 Ok(response) => return Ok(response),
                 Err(e) => {
                     tracing::warn!(
@@ -211,7 +228,7 @@ impl InferenceClient {
         })
     }
 
-    async fn log_inference_request(&self, req: &serde_json::Value, id: u64) {
+    async fn log_inference_request(&self, req: &ChatRequest<'_>, id: u64) {
         if let Ok(json) = serde_json::to_string_pretty(req) {
             let filename = format!("/sandbox/logs/inference_{}_request.json", id);
             if let Err(e) = tokio::fs::write(&filename, json).await {
@@ -228,16 +245,16 @@ impl InferenceClient {
     }
 }
 
-fn build_request(
-    messages: Vec<ChatMessage>,
-    system_prompt: Option<String>,
-    model_name: &str,
-) -> Result<serde_json::Value> {
-    let mut request_messages: Vec<ChatRequestMessage> = Vec::new();
+fn build_request<'a>(
+    messages: &'a [ChatMessage],
+    system_prompt: Option<&'a str>,
+    model_name: &'a str,
+) -> Result<ChatRequest<'a>> {
+    let mut request_messages: Vec<ChatRequestMessage<'a>> = Vec::with_capacity(messages.len() + 1);
 
     if let Some(sp) = system_prompt {
         request_messages.push(ChatRequestMessage {
-            role: "system".to_string(),
+            role: "system",
             content: sp,
             name: None,
             tool_call_id: None,
@@ -249,11 +266,17 @@ fn build_request(
         if trimmed.is_empty() {
             continue;
         }
+        // Tool results are sent to the provider as user turns.
+        let role = if msg.role.eq_ignore_ascii_case("tool") {
+            "user"
+        } else {
+            msg.role.as_str()
+        };
         request_messages.push(ChatRequestMessage {
-            role: msg.role.clone(),
-            content: trimmed.to_string(),
-            name: msg.name.clone(),
-            tool_call_id: msg.tool_call_id.clone(),
+            role,
+            content: trimmed,
+            name: msg.name.as_deref(),
+            tool_call_id: msg.tool_call_id.as_deref(),
         });
     }
 
@@ -261,17 +284,16 @@ fn build_request(
         return Err(HostError::Model("No messages provided".to_string()));
     }
 
-    let req = ChatRequest {
-        model: model_name.to_string(),
+    // Returned as the typed request so it is serialized straight to the body,
+    // without building an intermediate serde_json::Value tree first.
+    Ok(ChatRequest {
+        model: model_name,
         messages: request_messages,
         stream: false,
-    };
-
-    serde_json::to_value(&req)
-        .map_err(|e| HostError::Model(format!("Failed to serialize request: {}", e)))
+    })
 }
 
-fn parse_response(response_text: &str, estimated_context_length: i64) -> Result<ModelResponse> {
+fn parse_response(response_text: &str, messages: &[ChatMessage]) -> Result<ModelResponse> {
     let parsed: ChatResponse = serde_json::from_str(response_text)
         .map_err(|e| HostError::Model(format!("Failed to parse response: {}", e)))?;
 
@@ -283,10 +305,11 @@ fn parse_response(response_text: &str, estimated_context_length: i64) -> Result<
 
     let raw_content = choice.message.content.unwrap_or_default();
     let usage = parsed.usage.unwrap_or_default();
+    // Only walk the prompt for an estimate when the provider omits usage.
     let context_length = usage
         .prompt_tokens
         .or(usage.total_tokens)
-        .unwrap_or(estimated_context_length);
+        .unwrap_or_else(|| InferenceClient::estimate_context_length(messages));
 
     Ok(ModelResponse {
         content: Some(raw_content.trim().to_string()),
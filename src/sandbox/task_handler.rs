@@ -34,6 +34,8 @@ pub struct TaskHandler {
     inference_client: Arc<InferenceClient>,
     guardrails: Arc<Guardrails>,
     toolkit: Arc<ToolCatalog>,
+    tool_catalog_prompt: String,
+    host_name: String,
     processed_task_ids: Arc<Mutex<HashSet<String>>>,
     request_created_at: DateTime<Utc>,
 }
@@ -70,11 +72,19 @@ impl TaskHandler {
                 Utc::now()
             });
 
+        let host_name = std::env::var("TSBX_HOST_NAME").unwrap_or_else(|_| "TSBX".to_string());
+
+        // The tool reference is static; render it once instead of on every step.
+        let toolkit = Arc::new(ToolCatalog::new());
+        let tool_catalog_prompt = toolkit.command_catalog_prompt();
+
         Self {
             api_client,
             inference_client,
             guardrails,
-            toolkit: Arc::new(ToolCatalog::new()),
+            toolkit,
+            tool_catalog_prompt,
+            host_name,
             processed_task_ids: Arc::new(Mutex::new(HashSet::new())),
             request_created_at,
         }
@@ -133,12 +143,16 @@ impl TaskHandler {
         }
 
         let mut pending: Vec<TaskSummary> = Vec::new();
-        for task in &recent {
-            if task.status.eq_ignore_ascii_case("queued") {
-                if let Ok(created) = DateTime::parse_from_rfc3339(&task.created_at) {
-                    if created.with_timezone(&Utc) >= self.request_created_at {
-                        if !self.processed_task_ids.lock().await.contains(&task.id) {
-                            pending.push(task.clone());
+        {
+            // Take the lock once for the whole window rather than once per task.
+            let processed = self.processed_task_ids.lock().await;
+            for task in &recent {
+                if task.status.eq_ignore_ascii_case("queued") {
+                    if let Ok(created) = DateTime::parse_from_rfc3339(&task.created_at) {
+                        if created.with_timezone(&Utc) >= self.request_created_at {
+                            if !processed.contains(&task.id) {
+                                pending.push(task.clone());
+                            }
                         }
                     }
                 }
@@ -234,15 +248,9 @@ impl TaskHandler {
             }
 
             let system_prompt = self.build_system_prompt().await;
-            let mut model_conversation = conversation.clone();
-            for msg in &mut model_conversation {
-                if msg.role.eq_ignore_ascii_case("tool") {
-                    msg.role = "user".to_string();
-                }
-            }
             let response = match self
                 .inference_client
-                .complete(model_conversation.clone(), Some(system_prompt))
+                .complete(&conversation, Some(&system_prompt))
                 .await
             {
                 Ok(resp) => resp,
@@ -263,8 +271,8 @@ impl TaskHandler {
                 context_length,
             } = response;
 
-            let context_length = context_length
-                .unwrap_or_else(|| Self::estimate_context_length(&model_conversation));
+            let context_length =
+                context_length.unwrap_or_else(|| Self::estimate_context_length(&conversation));
             let prompt_tokens_value = prompt_tokens.unwrap_or(0).max(0);
             let completion_tokens_value = completion_tokens.unwrap_or(0).max(0);
             if let Err(err) = self
@@ -666,11 +674,8 @@ impl TaskHandler {
     }
 
     async fn build_system_prompt(&self) -> String {
-        let host_name = std::env::var("TSBX_HOST_NAME").unwrap_or_else(|_| "TSBX".to_string());
-        let sandbox_id = match self.api_client.get_sandbox().await {
-            Ok(sandbox) => sandbox.id,
-            Err(_) => "unknown".to_string(),
-        };
+        let host_name = &self.host_name;
+        let sandbox_id = self.api_client.sandbox_id();
         let current_time_utc = chrono::Utc::now().to_rfc3339();
 
         let mut prompt = String::new();
@@ -736,7 +741,7 @@ Current UTC time: {current_time_utc}\nSandbox ID: {sandbox_id}\n\n"
         prompt.push_str("- Do not ignore tool failures; diagnose and rerun the failing call until it succeeds before issuing other tool calls.\n");
         prompt.push_str("- Do not perform \"cleanup\" or additional refactors beyond what the instructions require.\n\n");
 
-        match std::fs::read_to_string("/sandbox/instructions.md") {
+        match tokio::fs::read_to_string("/sandbox/instructions.md").await {
             Ok(contents) => {
                 let trimmed = contents.trim();
                 if !trimmed.is_empty() {
@@ -753,7 +758,7 @@ Current UTC time: {current_time_utc}\nSandbox ID: {sandbox_id}\n\n"
             }
         }
 
-        prompt.push_str(&self.toolkit.command_catalog_prompt());
+        prompt.push_str(&self.tool_catalog_prompt);
 
         prompt
     }
@@ -1,5 +1,5 @@
 use crate::shared::config::TsbxConfig;
-use crate::shared::models::{AppState, DatabaseError};
+use crate::shared::models::{AppState, DatabaseError, TaskWaiters};
 use crate::shared::rbac::{Operator, Role, RoleBinding, SubjectType};
 use chrono::Utc;
 use sqlx::{query, Row};
@@ -631,5 +631,6 @@ pub async fn init_database(
         jwt_secret,
         config,
         inference_registry,
+        task_waiters: Arc::new(TaskWaiters::new()),
     })
 }
@@ -1,6 +1,9 @@
 use sqlx::{MySql, Pool};
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
 use thiserror::Error;
+use tokio::sync::futures::Notified;
+use tokio::sync::Notify;
 
 use crate::shared::{config::TsbxConfig, inference::InferenceRegistry};
 
@@ -51,4 +54,138 @@ pub struct AppState {
     pub jwt_secret: String,
     pub config: Arc<TsbxConfig>,
     pub inference_registry: Arc<InferenceRegistry>,
+    /// Per-task wake-ups for requests waiting on a task to reach a terminal status.
+    pub task_waiters: Arc<TaskWaiters>,
+}
+
+/// Registry of in-flight waiters keyed by task id, so a task finishing only
+/// wakes the requests waiting on that task.
+#[derive(Default)]
+pub struct TaskWaiters {
+    waiters: Mutex<HashMap<String, Arc<Notify>>>,
+}
+
+impl TaskWaiters {
+    pub fn new() -> Self {
+        Self::default()
+    }
+
+    /// Register interest in a task; the returned handle unregisters on drop.
+    pub fn register(&self, task_id: &str) -> TaskWaiter<'_> {
+        let notify = self
+            .waiters
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .entry(task_id.to_string())
+            .or_insert_with(|| Arc::new(Notify::new()))
+            .clone();
+        TaskWaiter {
+            registry: self,
+            task_id: task_id.to_string(),
+            notify,
+        }
+    }
+
+    /// Wake waiters for the given tasks; ids nobody is waiting on are skipped.
+    pub fn notify<'a>(&self, task_ids: impl IntoIterator<Item = &'a str>) {
+        let waiters = self.waiters.lock().unwrap_or_else(|e| e.into_inner());
+        for task_id in task_ids {
+            if let Some(notify) = waiters.get(task_id) {
+                notify.notify_waiters();
+            }
+        }
+    }
+}
+
+pub struct TaskWaiter<'a> {
+    registry: &'a TaskWaiters,
+    task_id: String,
+    notify: Arc<Notify>,
+}
+
+impl TaskWaiter<'_> {
+    pub fn notified(&self) -> Notified<'_> {
+        self.notify.notified()
+    }
+}
+
+impl Drop for TaskWaiter<'_> {
+    fn drop(&mut self) {
+        let mut waiters = self
+            .registry
+            .waiters
+            .lock()
+            .unwrap_or_else(|e| e.into_inner());
+        // Only the map and this handle hold the Notify: no other waiter remains.
+        if let Some(notify) = waiters.get(&self.task_id) {
+            if Arc::ptr_eq(notify, &self.notify) && Arc::strong_count(notify) <= 2 {
+                waiters.remove(&self.task_id);
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::time::Duration;
+
+    fn entry_count(registry: &TaskWaiters) -> usize {
+        registry.waiters.lock().unwrap().len()
+    }
+
+    #[tokio::test]
+    async fn notify_wakes_enabled_waiter() {
+        let registry = TaskWaiters::new();
+        let waiter = registry.register("task-1");
+        let notified = waiter.notified();
+        tokio::pin!(notified);
+        notified.as_mut().enable();
+
+        registry.notify(["task-1"]);
+
+        tokio::time::timeout(Duration::from_secs(1), notified)
+            .await
+            .expect("waiter should be woken by notify");
+    }
+
+    #[tokio::test]
+    async fn notify_for_unregistered_id_is_noop() {
+        let registry = TaskWaiters::new();
+        let waiter = registry.register("task-1");
+        let notified = waiter.notified();
+        tokio::pin!(notified);
+        notified.as_mut().enable();
+
+        registry.notify(["task-2"]);
+
+        assert!(tokio::time::timeout(Duration::from_millis(50), notified)
+            .await
+            .is_err());
+        assert_eq!(entry_count(&registry), 1);
+    }
+
+    #[test]
+    fn dropping_last_waiter_removes_entry() {
+        let registry = TaskWaiters::new();
+        let waiter = registry.register("task-1");
+        assert_eq!(entry_count(&registry), 1);
+
+        drop(waiter);
+
+        assert_eq!(entry_count(&registry), 0);
+    }
+
+    #[test]
+    fn dropping_one_of_two_waiters_keeps_entry() {
+        let registry = TaskWaiters::new();
+        let first = registry.register("task-1");
+        let second = registry.register("task-1");
+
+        drop(first);
+        assert_eq!(entry_count(&registry), 1);
+
+        drop(second);
+        assert_eq!(entry_count(&registry), 0);
+    }
 }